@@ -2,11 +2,22 @@
     Main API class.
 """
 import os
+from functools import cached_property
 from typing import Optional
 
+import eventlet
+import requests
+from requests.adapters import HTTPAdapter
+
 from pipedrive.deal import DealAPI
+from pipedrive.exceptions import PipedriveAPIError
 from pipedrive.organization import OrganizationAPI
 from pipedrive.person import PersonAPI
+from pipedrive.ratelimit import PipedriveRetry, RateLimitedAdapter, TokenBucket
+
+__all__ = ["Pipedrive", "PipedriveAPIError"]
+
+RETRY_TOTAL = 3
 
 
 class Pipedrive:
@@ -14,7 +25,15 @@ class Pipedrive:
     The Pipedrive API.
     """
 
-    def __init__(self, subdomain: str, api_key: Optional[str] = None, timeout: Optional[int] = 5):
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        subdomain: str,
+        api_key: Optional[str] = None,
+        timeout: Optional[int] = 5,
+        concurrency: int = 16,
+        rate_limit: Optional[int] = 80,
+        rate_period: float = 2,
+    ):
         if not subdomain:
             raise ValueError("Subdomain is required.")
         self.base_url = f"https://{subdomain}.pipedrive.com/api/v1/"
@@ -26,11 +45,66 @@ class Pipedrive:
                 "The API Key is required, pass api_key or "
                 "set the PIPEDRIVE_API_KEY environment variable."
             )
-        self.api_token = f"api_token={self.api_key}"
         self.timeout = timeout
-        self.deals = DealAPI(self)
-        self.organizations = OrganizationAPI(self)
-        self.people = PersonAPI(self)
+        self.limiter = (
+            TokenBucket(rate_limit, rate_period) if rate_limit else None
+        )
+        self.session = self._create_session()
+        self.pool = eventlet.GreenPool(concurrency)
+
+    @cached_property
+    def deals(self) -> DealAPI:
+        """
+        The Deal API, created on first access.
+        """
+        return DealAPI(self)
+
+    @cached_property
+    def organizations(self) -> OrganizationAPI:
+        """
+        The Organization API, created on first access.
+        """
+        return OrganizationAPI(self)
+
+    @cached_property
+    def people(self) -> PersonAPI:
+        """
+        The Person API, created on first access.
+        """
+        return PersonAPI(self)
+
+    def _create_session(self) -> requests.Session:
+        """
+        Create a session that keeps connections to the Pipedrive host alive,
+        stays under the rate limit and retries transient failures.
+
+        :return: A configured session.
+        """
+        session = requests.Session()
+        session.headers["x-api-token"] = self.api_key
+        # Spend at most half the per-call timeout waiting between retries,
+        # so they run out before it does. See PipedriveRetry.
+        retry_budget = self.timeout / 2 if self.timeout else None
+        adapter_kwargs = {
+            "pool_connections": 1,
+            "pool_maxsize": 40,
+            "max_retries": PipedriveRetry(
+                total=RETRY_TOTAL,
+                backoff_factor=0.5,
+                status_forcelist=[429, 502, 503, 504],
+                allowed_methods=frozenset(["GET", "PUT"]),
+                respect_retry_after_header=True,
+                raise_on_status=False,
+                budget=retry_budget,
+                limiter=self.limiter,
+            ),
+        }
+        if self.limiter is None:
+            adapter = HTTPAdapter(**adapter_kwargs)
+        else:
+            adapter = RateLimitedAdapter(self.limiter, **adapter_kwargs)
+        session.mount("https://", adapter)
+        return session
 
     def __repr__(self):
         return f"Pipedrive('{self.base_url}')"
@@ -1,18 +1,17 @@
 """
     Class to interact with the Pipedrive API for Deals.
 """
-from typing import Dict, List, Optional
+from typing import Dict, Iterator, List, Optional
 
-import requests
 import eventlet
 
-from pipedrive.mixins import FieldsMixin, URIMixin
+from pipedrive.mixins import BulkMixin, FieldsMixin, URIMixin
 from pipedrive.utils import append_params, process_response
 
 eventlet.monkey_patch()
 
 
-class DealAPI(URIMixin, FieldsMixin):
+class DealAPI(URIMixin, FieldsMixin, BulkMixin):
     """
     The Deal API.
     """
@@ -22,8 +21,6 @@ class DealAPI(URIMixin, FieldsMixin):
         self.fields_endpoint = "dealFields"
         self.deal_endpoint = f"{self.base_endpoint}/"
         self.pipedrive = pipedrive
-        self.fields = None
-        self._get_fields()
 
     def create(self, organization_id, person_id, title: str, **extra_fields):
         """
@@ -44,7 +41,7 @@ class DealAPI(URIMixin, FieldsMixin):
         }
 
         with eventlet.Timeout(self.pipedrive.timeout):
-            req = requests.post(self._get_base_uri(), data=payload, )
+            req = self.pipedrive.session.post(self._get_base_uri(), data=payload)
         return process_response(req)
 
     def update_deal(self, deal_id, fields: Dict) -> None:
@@ -57,7 +54,7 @@ class DealAPI(URIMixin, FieldsMixin):
         :return:
         """
         with eventlet.Timeout(self.pipedrive.timeout):
-            requests.put(self._get_details_uri(deal_id), data=fields)
+            self.pipedrive.session.put(self._get_details_uri(deal_id), data=fields)
 
     def get_all(  # pylint: disable=too-many-arguments
         self,
@@ -109,8 +106,78 @@ class DealAPI(URIMixin, FieldsMixin):
             "sort": sort,
             "owned_by_you": owned_by_you,
         }
-        uri = append_params(uri, params, True)
+        uri = append_params(uri, params)
 
         with eventlet.Timeout(self.pipedrive.timeout):
-            req = requests.get(uri)
+            req = self.pipedrive.session.get(uri)
         return process_response(req)
+
+    def get_all_pages(  # pylint: disable=too-many-arguments
+        self,
+        filter_id: Optional[int] = None,
+        stage_id: Optional[int] = None,
+        user_id: Optional[int] = None,
+        status: Optional[str] = None,
+        sort: Optional[str] = None,
+        owned_by_you: Optional[int] = None,  # 0 or 1
+        limit: int = 100,
+    ) -> List:
+        """
+        Get all deals, following pagination.
+
+        Takes the same filters as get_all, pages are fetched concurrently.
+
+        :param filter_id: The ID of the filter to use
+        :param stage_id: Only deals within the given stage
+        :param user_id: Only deals matching the given user
+        :param status: Only fetch deals with a specific status.
+        :param sort: The field names and sorting mode
+        :param owned_by_you: Only deals owned by you
+        :param limit: Items requested per page
+
+        :return: A list of all deals.
+        """
+        params = {
+            "filter_id": filter_id,
+            "stage_id": stage_id,
+            "user_id": user_id,
+            "status": status,
+            "sort": sort,
+            "owned_by_you": owned_by_you,
+        }
+        return self._get_all_pages(self._get_base_uri(), params, limit)
+
+    def iter_all(  # pylint: disable=too-many-arguments
+        self,
+        filter_id: Optional[int] = None,
+        stage_id: Optional[int] = None,
+        user_id: Optional[int] = None,
+        status: Optional[str] = None,
+        sort: Optional[str] = None,
+        owned_by_you: Optional[int] = None,  # 0 or 1
+        limit: int = 100,
+    ) -> Iterator:
+        """
+        Iterate over all deals, following pagination.
+
+        Takes the same filters as get_all, responses are streamed.
+
+        :param filter_id: The ID of the filter to use
+        :param stage_id: Only deals within the given stage
+        :param user_id: Only deals matching the given user
+        :param status: Only fetch deals with a specific status.
+        :param sort: The field names and sorting mode
+        :param owned_by_you: Only deals owned by you
+        :param limit: Items requested per page, at most 500
+
+        :return: An iterator over all deals.
+        """
+        params = {
+            "filter_id": filter_id,
+            "stage_id": stage_id,
+            "user_id": user_id,
+            "status": status,
+            "sort": sort,
+            "owned_by_you": owned_by_you,
+        }
+        return self._iter_pages(self._get_base_uri(), params, limit)
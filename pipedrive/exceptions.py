@@ -0,0 +1,33 @@
+"""
+    Exceptions raised by the Pipedrive API client.
+"""
+from typing import Callable, Mapping, Optional
+
+
+class PipedriveAPIError(Exception):
+    """
+    An error status returned by the Pipedrive API.
+
+    The response body is only read when `text` is accessed.
+    """
+
+    def __init__(
+        self, status_code: int, headers: Mapping, get_text: Callable[[], str]
+    ):
+        super().__init__(status_code)
+        self.status_code = status_code
+        self.headers = headers
+        self._get_text = get_text
+        self._text: Optional[str] = None
+
+    @property
+    def text(self) -> str:
+        """
+        The body of the error response.
+        """
+        if self._text is None:
+            self._text = self._get_text()
+        return self._text
+
+    def __str__(self):
+        return f"{self.status_code}: {self.text}"
@@ -1,11 +1,51 @@
 """
     Mixin classes for Pipedrive API
 """
-import requests
+import time
+from typing import (
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    NamedTuple,
+    Optional,
+    Tuple,
+)
+
 import eventlet
 
+from pipedrive.utils import (
+    json_loads,
+    process_paginated_response,
+    process_response_iter,
+)
+
 eventlet.monkey_patch()
 
+FIELDS_CACHE_TTL = 3600
+
+# The largest page size Pipedrive list endpoints return.
+MAX_PAGE_LIMIT = 500
+
+
+class _CachedFields(NamedTuple):
+    """
+    Field metadata of an API and the validators needed to revalidate it.
+    """
+
+    expiry: float
+    fields: List
+    fields_by_key: Dict
+    fields_by_name: Dict
+    etag: Optional[str]
+    last_modified: Optional[str]
+
+
+# Field metadata shared by every client in the process,
+# keyed by (fields endpoint URI, api key).
+_fields_cache: Dict[Tuple[str, str], _CachedFields] = {}
+
 
 class URIMixin:  # pylint: disable=too-few-public-methods
     """
@@ -18,10 +58,7 @@ class URIMixin:  # pylint: disable=too-few-public-methods
 
         :return: URI
         """
-        return (
-            f"{self.pipedrive.base_url}/{self.base_endpoint}?"
-            f"{self.pipedrive.api_token}"
-        )
+        return f"{self.pipedrive.base_url}{self.base_endpoint}"
 
     def _get_fields_endpoint_uri(self) -> str:
         """
@@ -29,10 +66,7 @@ class URIMixin:  # pylint: disable=too-few-public-methods
 
         :return: URI
         """
-        return (
-            f"{self.pipedrive.base_url}{self.fields_endpoint}?"
-            f"{self.pipedrive.api_token}"
-        )
+        return f"{self.pipedrive.base_url}{self.fields_endpoint}"
 
     def _get_details_uri(self, obj_id) -> str:
         """
@@ -42,10 +76,101 @@ class URIMixin:  # pylint: disable=too-few-public-methods
 
         :return: uri
         """
-        return (
-            f"{self.pipedrive.base_url}{self.base_endpoint}/{obj_id}?"
-            f"{self.pipedrive.api_token}"
-        )
+        return f"{self.pipedrive.base_url}{self.base_endpoint}/{obj_id}"
+
+
+class BulkMixin:  # pylint: disable=too-few-public-methods
+    """
+    Provides concurrent fan-out of single-object calls.
+    """
+
+    def _map_concurrently(self, func: Callable, keys: Iterable) -> Dict:
+        """
+        Call a function for each key using the client's green thread pool.
+
+        :param func: A callable taking a single key
+        :param keys: The keys to call the function with
+
+        :return: A dict of key to result, in the order of the keys.
+        """
+        keys = list(keys)
+        return dict(zip(keys, self.pipedrive.pool.imap(func, keys)))
+
+    def _get_all_pages(self, uri: str, params: Dict, limit: int = 100) -> List:
+        """
+        Get every item of a paginated list endpoint.
+
+        After the first page, the following pages are requested
+        concurrently, doubling the number fetched at once each round up to
+        the pool size, so small collections cost few extra requests.
+
+        :param uri: The list endpoint URI
+        :param params: The query parameters, without start and limit
+        :param limit: Items requested per page, at most MAX_PAGE_LIMIT
+
+        :return: A list of all items.
+        """
+        limit = min(limit, MAX_PAGE_LIMIT)
+
+        def get_page(start: int) -> Tuple[Optional[List], Dict]:
+            with eventlet.Timeout(self.pipedrive.timeout):
+                req = self.pipedrive.session.get(
+                    uri, params={**params, "start": start, "limit": limit}
+                )
+            return process_paginated_response(req)
+
+        data, pagination = get_page(0)
+        items = list(data or [])
+        window = 1
+        while data and pagination.get("more_items_in_collection"):
+            # Step by what the server returned, it may cap the page size.
+            page_size = len(data)
+            next_start = pagination.get(
+                "next_start", pagination.get("start", 0) + page_size
+            )
+            starts = [next_start + page * page_size for page in range(window)]
+            for data, pagination in self.pipedrive.pool.imap(get_page, starts):
+                items.extend(data or [])
+                if not data or not pagination.get("more_items_in_collection"):
+                    break
+            window = min(window * 2, self.pipedrive.pool.size)
+        return items
+
+    def _iter_pages(self, uri: str, params: Dict, limit: int = 100) -> Iterator:
+        """
+        Iterate over every item of a paginated list endpoint.
+
+        Pages are requested one at a time and streamed, so only the
+        current item has to be held in memory.
+
+        :param uri: The list endpoint URI
+        :param params: The query parameters, without start and limit
+        :param limit: Items requested per page, at most MAX_PAGE_LIMIT
+
+        :return: An iterator over all items.
+        """
+        limit = min(limit, MAX_PAGE_LIMIT)
+        start = 0
+        while True:
+            # The body is read after the eventlet timeout exits, so also
+            # pass the timeout to requests to bound each socket read.
+            with eventlet.Timeout(self.pipedrive.timeout):
+                req = self.pipedrive.session.get(
+                    uri,
+                    params={**params, "start": start, "limit": limit},
+                    stream=True,
+                    timeout=self.pipedrive.timeout,
+                )
+            count = 0
+            pagination: Dict = {}
+            with req:
+                for item in process_response_iter(req, pagination):
+                    count += 1
+                    yield item
+            if not count or not pagination.get("more_items_in_collection"):
+                return
+            # Step by what the server returned, it may cap the page size.
+            start = pagination.get("next_start", pagination.get("start", start) + count)
 
 
 class FieldsMixin:
@@ -59,28 +184,115 @@ class FieldsMixin:
     # def _get_fields_endpoint_uri(self) -> str:
     #    raise NotImplementedError()
 
+    _fields: Optional[List] = None
+    _fields_by_key: Optional[Dict] = None
+    _fields_by_name: Optional[Dict] = None
+
+    @property
+    def fields(self) -> Optional[List]:
+        """
+        The fields of the API, fetched on first access.
+        """
+        return self._get_fields()
+
+    @property
+    def fields_by_key(self) -> Optional[Dict]:
+        """
+        The fields of the API by key, fetched on first access.
+        """
+        self._get_fields()
+        return self._fields_by_key
+
+    @property
+    def fields_by_name(self) -> Optional[Dict]:
+        """
+        The fields of the API by lowered name, fetched on first access.
+        """
+        self._get_fields()
+        return self._fields_by_name
+
+    def _get_fields_cache_key(self) -> Tuple[str, str]:
+        """
+        Get the key of this API's fields in the shared fields cache.
+
+        :return: cache key
+        """
+        return self._get_fields_endpoint_uri(), self.pipedrive.api_key
+
     def _get_fields(self, no_cache: bool = False):
         """
         Get the fields for the API and caches them.
 
+        The fields are fetched on first use and shared between clients using
+        the same API key for FIELDS_CACHE_TTL seconds. After that, or with
+        no_cache, they are revalidated with a conditional request.
+
         :param no_cache: Don't retrieve from cache
 
         :return:
         """
-        if self.fields and not no_cache:
-            return self.fields
+        if self._fields is not None and not no_cache:
+            return self._fields
 
+        cache_key = self._get_fields_cache_key()
+        cached = _fields_cache.get(cache_key)
+        if cached and not no_cache and cached.expiry > time.monotonic():
+            return self._set_fields(cached)
+
+        headers = {}
+        if cached and cached.etag:
+            headers["If-None-Match"] = cached.etag
+        if cached and cached.last_modified:
+            headers["If-Modified-Since"] = cached.last_modified
         with eventlet.Timeout(self.pipedrive.timeout):
-            req = requests.get(self._get_fields_endpoint_uri())
-        json_data = req.json()
+            req = self.pipedrive.session.get(
+                self._get_fields_endpoint_uri(), headers=headers
+            )
+        if cached and req.status_code == 304:
+            cached = cached._replace(expiry=time.monotonic() + FIELDS_CACHE_TTL)
+            _fields_cache[cache_key] = cached
+            return self._set_fields(cached)
+
+        json_data = json_loads(req.content)
         if not json_data["success"]:
             return None
-        self.fields = json_data["data"]
-        self.fields_by_key = {field["key"]: field for field in json_data["data"]}
-        self.fields_by_name = {
-            field["name"].lower(): field for field in json_data["data"]
-        }
-        return self.fields
+        fields_by_key = {}
+        fields_by_name = {}
+        for field in json_data["data"]:
+            fields_by_key[field["key"]] = field
+            fields_by_name[field["name"].lower()] = field
+        cached = _CachedFields(
+            expiry=time.monotonic() + FIELDS_CACHE_TTL,
+            fields=json_data["data"],
+            fields_by_key=fields_by_key,
+            fields_by_name=fields_by_name,
+            etag=req.headers.get("ETag"),
+            last_modified=req.headers.get("Last-Modified"),
+        )
+        _fields_cache[cache_key] = cached
+        return self._set_fields(cached)
+
+    def _set_fields(self, cached: _CachedFields):
+        """
+        Use cached field metadata for this API.
+
+        :param cached: The cached fields
+
+        :return: The fields
+        """
+        self._fields = cached.fields
+        self._fields_by_key = cached.fields_by_key
+        self._fields_by_name = cached.fields_by_name
+        return self._fields
+
+    def _invalidate_fields(self) -> None:
+        """
+        Drop the cached fields so the next lookup fetches them again.
+
+        :return: None
+        """
+        self._fields = None
+        _fields_cache.pop(self._get_fields_cache_key(), None)
 
     def get_field_by_name(self, name: str):
         """
@@ -90,8 +302,10 @@ class FieldsMixin:
 
         :return: A field, maybe.
         """
+        if self._get_fields() is None:
+            return None
         name = name.lower()
-        return self.fields_by_name.get(name)
+        return self._fields_by_name.get(name)
 
     def get_field_by_key(self, key: str):
         """
@@ -101,4 +315,6 @@ class FieldsMixin:
 
         :return: A field, maybe.
         """
-        return self.fields_by_key.get(key)
+        if self._get_fields() is None:
+            return None
+        return self._fields_by_key.get(key)
@@ -1,80 +1,65 @@
 """
     Class to interact with the Pipedrive API for Organizations.
 """
-from typing import Dict, List, Optional, Tuple
-from urllib.parse import quote
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 
-import requests
 import eventlet
 
-from pipedrive.mixins import FieldsMixin, URIMixin
-from pipedrive.utils import process_response
+from pipedrive.mixins import BulkMixin, FieldsMixin, URIMixin
+from pipedrive.utils import MISS, TTLCache, process_response
 
 eventlet.monkey_patch()
 
 
 class OrganizationAPI(  # pylint: disable=too-many-instance-attributes
     URIMixin,
-    FieldsMixin
+    FieldsMixin,
+    BulkMixin,
 ):
     """
     The Organization API.
     """
 
+    CACHE_MAXSIZE = 10_000
+    CACHE_TTL = 300
+
     def __init__(self, pipedrive):
         self.base_endpoint = "organizations"
         self.fields_endpoint = "organizationFields"
         self.search_endpoint = f"{self.base_endpoint}/search"
         self.pipedrive = pipedrive
-        self.fields = None
-        self._get_fields()
-        self._details_cache = {}
-        self._find_cache = {}
-        self._people_cache = {}
-        self._deals_cache = {}
+        self._details_cache = TTLCache(self.CACHE_MAXSIZE, self.CACHE_TTL)
+        self._find_cache = TTLCache(self.CACHE_MAXSIZE, self.CACHE_TTL)
+        self._people_cache = TTLCache(self.CACHE_MAXSIZE, self.CACHE_TTL)
+        self._deals_cache = TTLCache(self.CACHE_MAXSIZE, self.CACHE_TTL)
 
-    def _get_deals_uri(self, org_id, start: int = 0) -> str:
+    def _get_deals_uri(self, org_id) -> str:
         """
         Get the deals endpoint URI.
 
         :param org_id: The Organization ID
-        :param start: The starting offset
 
         :return: uri
         """
-        return (
-            f"{self.pipedrive.base_url}{self.base_endpoint}/{org_id}/deals?"
-            f"start={start}&{self.pipedrive.api_token}"
-        )
+        return f"{self.pipedrive.base_url}{self.base_endpoint}/{org_id}/deals"
 
-    def _get_people_uri(self, org_id, start: int = 0) -> str:
+    def _get_people_uri(self, org_id) -> str:
         """
         Get the people endpoint URI.
 
         :param org_id: The Organization ID
-        :param start: The starting offset
 
         :return: uri
         """
-        return (
-            f"{self.pipedrive.base_url}{self.base_endpoint}/{org_id}/persons?"
-            f"start={start}&{self.pipedrive.api_token}"
-        )
+        return f"{self.pipedrive.base_url}{self.base_endpoint}/{org_id}/persons"
 
-    def _get_search_endpoint_uri(self, term, start: int = 0) -> str:
+    def _get_search_endpoint_uri(self) -> str:
         """
         Get the search endpoint URI.
 
-        :param term: the search term
-        :param start: the starting offset
-
         :return: uri
         """
-        quoted_term = quote(term)
-        return (
-            f"{self.pipedrive.base_url}{self.search_endpoint}?"
-            f"term={quoted_term}&start={start}&{self.pipedrive.api_token}"
-        )
+        return f"{self.pipedrive.base_url}{self.search_endpoint}"
 
     def get_details(self, org_id, no_cache: bool = False) -> Dict:
         """
@@ -86,15 +71,43 @@ class OrganizationAPI(  # pylint: disable=too-many-instance-attributes
         :return:
         """
         if not no_cache:
-            if org_id in self._details_cache:
-                return self._details_cache[org_id]
+            cached_details = self._details_cache.get(org_id, MISS)
+            if cached_details is not MISS:
+                return cached_details
 
         with eventlet.Timeout(self.pipedrive.timeout):
-            req = requests.get(self._get_details_uri(org_id))
+            req = self.pipedrive.session.get(self._get_details_uri(org_id))
         data = process_response(req)
         self._details_cache[org_id] = data
         return data
 
+    def get_details_many(self, org_ids: Iterable, no_cache: bool = False) -> Dict:
+        """
+        Get details about several organizations.
+
+        Cached organizations are returned as is, the others are fetched
+        concurrently.
+
+        :param org_ids: The Organization IDs
+        :param no_cache: Don't retrieve from cache
+
+        :return: A dict of Organization ID to details
+        """
+        details = {}
+        missing = []
+        for org_id in org_ids:
+            cached_details = MISS if no_cache else self._details_cache.get(org_id, MISS)
+            if cached_details is MISS:
+                missing.append(org_id)
+            else:
+                details[org_id] = cached_details
+        details.update(
+            self._map_concurrently(
+                lambda org_id: self.get_details(org_id, no_cache=True), missing
+            )
+        )
+        return details
+
     def find(self, term, no_cache: bool = False) -> List:
         """
         Find an organization by search term.
@@ -105,16 +118,31 @@ class OrganizationAPI(  # pylint: disable=too-many-instance-attributes
         :return:
         """
         if not no_cache:
-            cached_results = self._find_cache.get(term)
-            if cached_results:
+            cached_results = self._find_cache.get(term, MISS)
+            if cached_results is not MISS:
                 return cached_results
         with eventlet.Timeout(self.pipedrive.timeout):
-            req = requests.get(self._get_search_endpoint_uri(term))
+            req = self.pipedrive.session.get(
+                self._get_search_endpoint_uri(), params={"term": term, "start": 0}
+            )
         data = process_response(req)
         value = data["items"]
         self._find_cache[term] = value
         return value
 
+    def find_many(self, terms: Iterable, no_cache: bool = False) -> Dict[str, List]:
+        """
+        Find organizations for several search terms concurrently.
+
+        :param terms: the search terms
+        :param no_cache: Don't retrieve from cache
+
+        :return: A dict of search term to results
+        """
+        return self._map_concurrently(
+            lambda term: self.find(term, no_cache=no_cache), terms
+        )
+
     def create_field(self, name, field_type: str = "varchar") -> None:
         """
         Create a new custom field for an organization.
@@ -128,7 +156,8 @@ class OrganizationAPI(  # pylint: disable=too-many-instance-attributes
             "name": name,
             "field_type": field_type,
         }
-        requests.post(self._get_fields_endpoint_uri(), data=payload)
+        self.pipedrive.session.post(self._get_fields_endpoint_uri(), data=payload)
+        self._invalidate_fields()
 
     def create(self, name: str, address: str, visible_to: int = 3, **extra_fields):
         """
@@ -148,7 +177,7 @@ class OrganizationAPI(  # pylint: disable=too-many-instance-attributes
             **extra_fields,
         }
         with eventlet.Timeout(self.pipedrive.timeout):
-            req = requests.post(self._get_base_uri(), data=payload)
+            req = self.pipedrive.session.post(self._get_base_uri(), data=payload)
         return process_response(req)
 
     def get_people(self, organization_id, no_cache: bool = False) -> List:
@@ -161,11 +190,13 @@ class OrganizationAPI(  # pylint: disable=too-many-instance-attributes
         :return: List of People
         """
         if not no_cache:
-            cached_people = self._people_cache.get(organization_id)
-            if cached_people:
+            cached_people = self._people_cache.get(organization_id, MISS)
+            if cached_people is not MISS:
                 return cached_people
         with eventlet.Timeout(self.pipedrive.timeout):
-            req = requests.get(self._get_people_uri(organization_id))
+            req = self.pipedrive.session.get(
+                self._get_people_uri(organization_id), params={"start": 0}
+            )
         data = process_response(req)
         self._people_cache[organization_id] = data
         return data
@@ -180,15 +211,75 @@ class OrganizationAPI(  # pylint: disable=too-many-instance-attributes
         :return: A List of Deals
         """
         if not no_cache:
-            cached_deals = self._deals_cache.get(organization_id)
-            if cached_deals:
+            cached_deals = self._deals_cache.get(organization_id, MISS)
+            if cached_deals is not MISS:
                 return cached_deals
         with eventlet.Timeout(self.pipedrive.timeout):
-            req = requests.get(self._get_deals_uri(organization_id))
+            req = self.pipedrive.session.get(
+                self._get_deals_uri(organization_id), params={"start": 0}
+            )
         data = process_response(req)
         self._deals_cache[organization_id] = data
         return data
 
+    def iter_people(self, organization_id, limit: int = 100) -> Iterator:
+        """
+        Iterate over all people associated with an organization.
+
+        The responses are streamed and not cached.
+
+        :param organization_id: The Organization ID
+        :param limit: Items requested per page, at most 500
+
+        :return: An iterator over People
+        """
+        return self._iter_pages(self._get_people_uri(organization_id), {}, limit)
+
+    def iter_deals(self, organization_id, limit: int = 100) -> Iterator:
+        """
+        Iterate over all deals associated with an organization.
+
+        The responses are streamed and not cached.
+
+        :param organization_id: The Organization ID
+        :param limit: Items requested per page, at most 500
+
+        :return: An iterator over Deals
+        """
+        return self._iter_pages(self._get_deals_uri(organization_id), {}, limit)
+
+    def get_people_many(
+        self, organization_ids: Iterable, no_cache: bool = False
+    ) -> Dict:
+        """
+        Get the people of several organizations concurrently.
+
+        :param organization_ids: The Organization IDs
+        :param no_cache: Don't retrieve from cache
+
+        :return: A dict of Organization ID to List of People
+        """
+        return self._map_concurrently(
+            lambda org_id: self.get_people(org_id, no_cache=no_cache),
+            organization_ids,
+        )
+
+    def get_deals_many(
+        self, organization_ids: Iterable, no_cache: bool = False
+    ) -> Dict:
+        """
+        Get the deals of several organizations concurrently.
+
+        :param organization_ids: The Organization IDs
+        :param no_cache: Don't retrieve from cache
+
+        :return: A dict of Organization ID to List of Deals
+        """
+        return self._map_concurrently(
+            lambda org_id: self.get_deals(org_id, no_cache=no_cache),
+            organization_ids,
+        )
+
     def update(self, organization_id, fields: Dict) -> None:
         """
         Update an organization.
@@ -199,7 +290,9 @@ class OrganizationAPI(  # pylint: disable=too-many-instance-attributes
         :return: None
         """
         with eventlet.Timeout(self.pipedrive.timeout):
-            requests.put(self._get_details_uri(organization_id), data=fields)
+            self.pipedrive.session.put(
+                self._get_details_uri(organization_id), data=fields
+            )
 
     def filter_results(  # pylint: disable=too-many-arguments
         self,
@@ -274,7 +367,7 @@ class OrganizationAPI(  # pylint: disable=too-many-instance-attributes
                 score += 2
         return score
 
-    def filter_people_results(  # pylint: disable=too-many-arguments
+    def filter_people_results(  # pylint: disable=too-many-arguments,too-many-locals
         self, people, first_name, last_name, phone, email
     ):
         """
@@ -288,19 +381,29 @@ class OrganizationAPI(  # pylint: disable=too-many-instance-attributes
 
         :return:
         """
-        won_deals_found = False
         likely_match: Optional[Tuple] = None
         if people is None:
             return False, None
+        won_deals_found = any(person["won_deals_count"] for person in people)
         lower_first_name = first_name.lower() if first_name else None
         lower_last_name = last_name.lower() if last_name else None
         lower_email = email.lower() if email else None
+        # Nobody can beat a person matching every given value.
+        best_score = get_person_score(
+            lower_first_name is not None,
+            lower_last_name is not None,
+            lower_email is not None,
+            phone is not None,
+        )
 
-        for person in people:
-            if person["won_deals_count"]:
-                won_deals_found = True
+        normalized_people = [_normalize_person(person) for person in people]
+        for person, normalized in zip(people, normalized_people):
             found_values = filter_person(
-                person, lower_first_name, lower_last_name, lower_email, phone
+                normalized,
+                lower_first_name,
+                lower_last_name,
+                lower_email,
+                phone,
             )
             score = get_person_score(*found_values)
             if not score or score < 7:
@@ -311,9 +414,29 @@ class OrganizationAPI(  # pylint: disable=too-many-instance-attributes
                 likely_match: Tuple
                 if score > likely_match[0]:
                     likely_match = (score, person, *found_values)
+            if score == best_score:
+                break
         return won_deals_found, likely_match
 
 
+def _normalize_person(person: Dict) -> Dict:
+    """
+    Lower the names and emails of a person once so they can be matched
+    cheaply.
+
+    :param person: A person response dict.
+    :return: Dict of first_name, last_name, emails and phones.
+    """
+    return {
+        "first_name": (person["first_name"] or "").lower(),
+        "last_name": (person["last_name"] or "").lower(),
+        "emails": frozenset(
+            person_email["value"].lower() for person_email in person["email"]
+        ),
+        "phones": frozenset(person_phone["value"] for person_phone in person["phone"]),
+    }
+
+
 def filter_person(
     person: Dict,
     lower_first_name: Optional[str],
@@ -323,28 +446,19 @@ def filter_person(
 ) -> Tuple[bool, bool, bool, bool]:
     """
     Filter a person by name, email, and phone.
-    :param person:
+    :param person: A person normalized by _normalize_person.
     :param lower_first_name:
     :param lower_last_name:
     :param lower_email:
     :param phone:
     :return: Tuple of found values: (first, last, email, phone)
     """
-    found_first_name = False
-    found_last_name = False
-
-    if (
-        person["first_name"]
-        and lower_first_name
-        and lower_first_name in person["first_name"].lower()
-    ):
-        found_first_name = True
-    if (
-        person["last_name"]
-        and lower_last_name
-        and lower_last_name in person["last_name"].lower()
-    ):
-        found_last_name = True
+    found_first_name = bool(
+        lower_first_name and lower_first_name in person["first_name"]
+    )
+    found_last_name = bool(
+        lower_last_name and lower_last_name in person["last_name"]
+    )
     found_phone = person_has_phone(phone, person)
     found_email = person_has_email(lower_email, person)
     return found_first_name, found_last_name, found_email, found_phone
@@ -354,16 +468,10 @@ def person_has_phone(phone: str, person: Dict) -> bool:
     """
     Check if a person has the phone number.
     :param phone: A phone number.
-        This is to avoid case sensitivity issues,
-        but should not be done in this function to
-        avoid excessive calls.
-    :param person: A person response dict.
+    :param person: A person normalized by _normalize_person.
     :return: bool
     """
-    for person_phone in person["phone"]:
-        if person_phone["value"] == phone:
-            return True
-    return False
+    return phone in person["phones"]
 
 
 def person_has_email(email: str, person: Dict) -> bool:
@@ -373,13 +481,10 @@ def person_has_email(email: str, person: Dict) -> bool:
         This is to avoid case sensitivity issues,
         but should not be done in this function to
         avoid excessive calls.
-    :param person: A person response dict.
+    :param person: A person normalized by _normalize_person.
     :return: bool
     """
-    for person_email in person["email"]:
-        if person_email["value"].lower() == email:
-            return True
-    return False
+    return email in person["emails"]
 
 
 def get_person_score(
@@ -3,7 +3,6 @@
 """
 from typing import List, Optional, Union
 
-import requests
 import eventlet
 
 from pipedrive.mixins import FieldsMixin, URIMixin
@@ -21,8 +20,6 @@ class PersonAPI(URIMixin, FieldsMixin):
         self.base_endpoint = "persons"
         self.fields_endpoint = "personFields"
         self.pipedrive = pipedrive
-        self.fields = None
-        self._get_fields()
 
     def update(
         self,
@@ -58,7 +55,9 @@ class PersonAPI(URIMixin, FieldsMixin):
         }
 
         with eventlet.Timeout(self.pipedrive.timeout):
-            req = requests.put(self._get_details_uri(person_id), data=payload)
+            req = self.pipedrive.session.put(
+                self._get_details_uri(person_id), data=payload
+            )
         return process_response(req)
 
     def create(  # pylint: disable=too-many-arguments
@@ -101,5 +100,5 @@ class PersonAPI(URIMixin, FieldsMixin):
             "visible_to": visible_to,
         }
         with eventlet.Timeout(self.pipedrive.timeout):
-            req = requests.post(self._get_base_uri(), data=payload)
+            req = self.pipedrive.session.post(self._get_base_uri(), data=payload)
         return process_response(req)
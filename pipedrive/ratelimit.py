@@ -0,0 +1,196 @@
+"""
+    Client side rate limiting and retries for the Pipedrive API.
+"""
+import threading
+import time
+from typing import Mapping, Optional
+
+from requests.adapters import HTTPAdapter
+from urllib3.exceptions import MaxRetryError, ResponseError
+from urllib3.util.retry import Retry
+
+
+def _header_float(headers: Mapping, name: str) -> Optional[float]:
+    """
+    Read a numeric header.
+
+    :param headers: The response headers
+    :param name: The header name
+
+    :return: The value as a float, maybe.
+    """
+    value = headers.get(name)
+    if value is None:
+        return None
+    try:
+        return float(value)
+    except ValueError:
+        return None
+
+
+class TokenBucket:
+    """
+    A thread safe token bucket allowing `rate` requests every `period` seconds.
+    """
+
+    def __init__(self, rate: float, period: float):
+        self.rate = float(rate)
+        self.period = float(period)
+        self._tokens = self.rate
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        """
+        Add the tokens accrued since the last refill.
+
+        :return: None
+        """
+        now = time.monotonic()
+        elapsed = now - self._updated
+        self._tokens = min(self.rate, self._tokens + elapsed * self.rate / self.period)
+        self._updated = now
+
+    def acquire(self) -> None:
+        """
+        Take a token, sleeping until one is available.
+
+        :return: None
+        """
+        while True:
+            with self._lock:
+                self._refill()
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) * self.period / self.rate
+            time.sleep(wait)
+
+    def update_from_headers(self, headers: Mapping) -> None:
+        """
+        Align the bucket with the X-RateLimit-* and Retry-After headers
+        Pipedrive returns.
+
+        :param headers: The response headers
+
+        :return: None
+        """
+        limit = _header_float(headers, "X-RateLimit-Limit")
+        remaining = _header_float(headers, "X-RateLimit-Remaining")
+        reset = _header_float(headers, "X-RateLimit-Reset")
+        retry_after = _header_float(headers, "Retry-After")
+        with self._lock:
+            self._refill()
+            if limit:
+                self.rate = limit
+            if remaining is not None:
+                self._tokens = min(self._tokens, remaining)
+                if remaining < 1 and reset:
+                    self._pause(reset)
+            if retry_after:
+                self._pause(retry_after)
+
+    def _pause(self, seconds: float) -> None:
+        """
+        Hold back the next token for at least `seconds`. Call with the lock.
+
+        :param seconds: How long to wait
+
+        :return: None
+        """
+        self._tokens = min(self._tokens, 1 - seconds * self.rate / self.period)
+
+
+class RateLimitedAdapter(HTTPAdapter):
+    """
+    An HTTPAdapter that takes a token from a bucket before each request.
+    """
+
+    def __init__(self, limiter: TokenBucket, *args, **kwargs):
+        self.limiter = limiter
+        super().__init__(*args, **kwargs)
+
+    def send(self, request, *args, **kwargs):  # pylint: disable=arguments-differ
+        self.limiter.acquire()
+        response = super().send(request, *args, **kwargs)
+        self.limiter.update_from_headers(response.headers)
+        return response
+
+
+class PipedriveRetry(Retry):
+    """
+    A Retry that only replays POST requests that were rate limited (429).
+
+    Any other POST failure may come after Pipedrive created the object,
+    so retrying it could create a duplicate. Waits between attempts,
+    Retry-After included, are counted against `budget` seconds: a retry
+    that would wait past it is not made and the response is returned
+    instead, so retries stay within the client's timeout. With a limiter,
+    every retry feeds the response headers to it and takes a token like
+    any other request.
+    """
+
+    def __init__(
+        self,
+        *args,
+        budget: Optional[float] = None,
+        limiter: Optional[TokenBucket] = None,
+        **kwargs,
+    ):
+        self.budget = budget
+        self.limiter = limiter
+        self.spent = 0.0
+        super().__init__(*args, **kwargs)
+
+    def new(self, **kw) -> "PipedriveRetry":
+        retry = super().new(**kw)
+        retry.budget = self.budget
+        retry.limiter = self.limiter
+        retry.spent = self.spent
+        return retry
+
+    def is_retry(
+        self, method: str, status_code: int, has_retry_after: bool = False
+    ) -> bool:
+        if method.upper() == "POST":
+            return status_code == 429 and bool(self.total)
+        return super().is_retry(method, status_code, has_retry_after)
+
+    def increment(  # pylint: disable=too-many-arguments
+        self,
+        method=None,
+        url=None,
+        response=None,
+        error=None,
+        _pool=None,
+        _stacktrace=None,
+    ) -> "PipedriveRetry":
+        retry = super().increment(
+            method=method,
+            url=url,
+            response=response,
+            error=error,
+            _pool=_pool,
+            _stacktrace=_stacktrace,
+        )
+        if self.budget is None:
+            return retry
+        wait = self.get_retry_after(response) if response is not None else None
+        if wait is None:
+            wait = retry.get_backoff_time()
+        if self.spent + wait > self.budget:
+            # Give up now rather than retry before the server allows.
+            raise MaxRetryError(
+                _pool,
+                url,
+                ResponseError(f"waiting {wait}s would exceed the retry budget"),
+            )
+        retry.spent = self.spent + wait
+        return retry
+
+    def sleep(self, response=None) -> None:
+        if self.limiter is not None and response is not None:
+            self.limiter.update_from_headers(response.headers)
+        super().sleep(response)
+        if self.limiter is not None:
+            self.limiter.acquire()
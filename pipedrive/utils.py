@@ -1,7 +1,76 @@
 """
     Utility Functions
 """
-from typing import Dict, List, Optional, Union
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Iterator, List, Optional, Tuple, Union
+from urllib.parse import urlencode
+
+import requests
+
+from pipedrive.exceptions import PipedriveAPIError
+
+try:
+    import ijson
+except ImportError:  # pragma: no cover
+    ijson = None
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+# orjson decodes large list responses several times faster when installed.
+json_loads = (
+    orjson.loads  # pylint: disable=no-member
+    if orjson is not None
+    else json.loads
+)
+
+# Returned by cache lookups when the key is absent, since None is a valid value.
+MISS = object()
+
+# The ijson parse events that carry a value.
+_SCALAR_EVENTS = frozenset(["null", "boolean", "integer", "double", "number", "string"])
+
+
+class TTLCache:
+    """
+    A cache bounded to `maxsize` entries that expire after `ttl` seconds.
+
+    The least recently used entry is evicted first once the cache is full.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict = OrderedDict()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """
+        Get a value that has not expired.
+
+        :param key: The key
+        :param default: Returned when the key is absent or expired
+
+        :return: The cached value or default.
+        """
+        item = self._data.get(key, MISS)
+        if item is MISS:
+            return default
+        expiry, value = item
+        if expiry <= time.monotonic():
+            del self._data[key]
+            return default
+        self._data.move_to_end(key)
+        return value
+
+    def __setitem__(self, key: Hashable, value: Any) -> None:
+        self._data[key] = (time.monotonic() + self.ttl, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
 
 
 def process_response(response) -> Optional[Union[Dict, List]]:
@@ -12,11 +81,110 @@ def process_response(response) -> Optional[Union[Dict, List]]:
 
     :return: A dictionary or list, maybe.
     """
-    if response.status_code == 200:
-        json_data = response.json()
-    else:
-        raise Exception(response.text)
+    return _get_data(_get_json_data(response))
+
+
+def process_paginated_response(response) -> Tuple[Optional[List], Dict]:
+    """
+    Processes a list response from the API.
+
+    :param response: The response from the API.
+
+    :return: A list, maybe, and the pagination details.
+    """
+    json_data = _get_json_data(response)
+    pagination = (json_data.get("additional_data") or {}).get("pagination") or {}
+    return _get_data(json_data), pagination
+
+
+def process_response_iter(response, pagination: Optional[Dict] = None) -> Iterator:
+    """
+    Processes a list response from the API, yielding its items one by one.
+
+    With ijson installed and a streamed response (stream=True), the items
+    are decoded as the body is read instead of building the whole list
+    first. Without ijson the body is decoded at once.
+
+    :param response: The response from the API.
+    :param pagination: A dict to fill with the pagination details,
+        complete once the items are exhausted.
 
+    :return: An iterator over the items.
+    """
+    # A streamed body can't be read once the caller closes the response.
+    _raise_for_status(response, read_body=True)
+    if ijson is None:
+        data, page = process_paginated_response(response)
+        if pagination is not None:
+            pagination.update(page)
+        yield from data or []
+        return
+    response.raw.decode_content = True
+    events = ijson.parse(response.raw, use_float=True)
+    if pagination is not None:
+        events = _collect_pagination(events, pagination)
+    yield from ijson.items(events, "data.item")
+
+
+def _collect_pagination(events: Iterator, pagination: Dict) -> Iterator:
+    """
+    Pass ijson parse events through, copying the pagination values seen.
+
+    :param events: The events from ijson.parse
+    :param pagination: The dict to copy the values of
+        additional_data.pagination to
+
+    :return: An iterator over the same events.
+    """
+    for prefix, event, value in events:
+        parent, _, key = prefix.rpartition(".")
+        if parent == "additional_data.pagination" and event in _SCALAR_EVENTS:
+            pagination[key] = value
+        yield prefix, event, value
+
+
+def _raise_for_status(response, read_body: bool = False) -> None:
+    """
+    Raise a PipedriveAPIError for a 4xx or 5xx response.
+
+    :param response: The response from the API.
+    :param read_body: Read the error body now instead of on access.
+
+    :return: None
+    """
+    try:
+        response.raise_for_status()
+    except requests.HTTPError as error:
+        if read_body:
+            # Requests keeps the content, so text still works after close.
+            _ = response.content
+        raise PipedriveAPIError(
+            response.status_code, response.headers, lambda: response.text
+        ) from error
+
+
+def _get_json_data(response) -> Dict:
+    """
+    Decode the JSON body of a successful response.
+
+    :param response: The response from the API.
+
+    :return: The decoded body.
+    """
+    _raise_for_status(response)
+    if not response.content:
+        return {}
+    return json_loads(response.content)
+
+
+def _get_data(json_data: Dict) -> Optional[Union[Dict, List]]:
+    """
+    Get the data out of a decoded response body.
+
+    :param json_data: The decoded body.
+
+    :return: A dictionary or list, maybe.
+    """
     if "success" in json_data and json_data["success"]:
         return json_data["data"]
     if "status" in json_data and not json_data["status"]:
@@ -28,17 +196,16 @@ def append_params(uri, params, not_first=False):
     """
     Appends parameters to a URI.
 
+    Parameters set to None are left out and values are URL encoded.
+
     :param uri: The URI
     :param params: The parameters
     :param not_first: Start with ? or &
 
     :return: URI with parameters
     """
-    first_param = not not_first
-    for key, value in params.items():
-        if value and first_param:
-            uri += f"?{key}={value}"
-            first_param = False
-        elif value:
-            uri += f"&{key}={value}"
-    return uri
+    filtered = {key: value for key, value in params.items() if value is not None}
+    if not filtered:
+        return uri
+    separator = "&" if not_first else "?"
+    return f"{uri}{separator}{urlencode(filtered)}"
@@ -21,8 +21,11 @@ setup(
         "Topic :: Software Development :: Libraries",
     ],
     install_requires=[
-        "requests", "eventlet"
+        "requests", "urllib3>=2", "eventlet"
     ],
+    extras_require={
+        "speedups": ["orjson", "ijson>=3.1"],
+    },
     version="0.2.1",
     zip_safe=False,
 )